@@ -56,7 +56,7 @@ Item {
 
     Process {
         id: devicesRefreshProc
-        command: ["sh", "-c", "bluetoothctl devices 2>/dev/null"]
+        command: ["bluetoothctl", "devices"]
         stdout: StdioCollector {
             onStreamFinished: {
                 deviceModel.clear();
@@ -29,7 +29,8 @@ Item {
 
     Process {
         id: refreshProc
-        command: ["sh", "-c", "pactl get-source-mute @DEFAULT_SOURCE@ 2>/dev/null"]
+        // argv form — no shell parse + fork just to run one binary
+        command: ["pactl", "get-source-mute", "@DEFAULT_SOURCE@"]
         stdout: StdioCollector {
             onStreamFinished: {
                 root.muted = text.indexOf("yes") !== -1;
@@ -16,6 +16,7 @@ Item {
     property int volume: 0
     property bool muted: false
     property string feedback: ""
+    readonly property var setCmdPrefix: ["pactl", "set-sink-volume", "@DEFAULT_SINK@"]
 
     // Emitted whenever the system-side state changes (so an OSD can react).
     signal externalChange(int volume, bool muted)
@@ -73,7 +74,17 @@ Item {
 
     Process {
         id: volumeSetProc
-        onExited: volumeRefreshProc.running = true
+        // Set queued while a pactl was still in flight (null = none).
+        property var pending: null
+        onExited: {
+            if (pending) {
+                command = pending;
+                pending = null;
+                running = true;
+            } else {
+                volumeRefreshProc.running = true;
+            }
+        }
     }
 
     Process {
@@ -96,9 +107,18 @@ Item {
         }
     }
 
+    // Immediate when idle, latest-wins while a set is in flight — a wheel
+    // burst collapses to one pactl instead of spawning per tick.
     function setVolume(value) {
         root.feedback = "applying...";
-        volumeSetProc.command = ["pactl", "set-sink-volume", "@DEFAULT_SINK@", Math.round(value) + "%"];
+        var v = Math.max(0, Math.min(100, Math.round(value)));
+        root.volume = v;  // track locally so burst steps accumulate
+        var cmd = root.setCmdPrefix.concat(v + "%");
+        if (volumeSetProc.running) {
+            volumeSetProc.pending = cmd;
+            return;
+        }
+        volumeSetProc.command = cmd;
         volumeSetProc.running = true;
     }
 
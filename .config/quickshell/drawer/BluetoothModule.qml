@@ -52,7 +52,7 @@ ColumnLayout {
 
     Process {
         id: devicesRefreshProc
-        command: ["sh", "-c", "bluetoothctl devices | grep Device"]
+        command: ["bluetoothctl", "devices"]
         running: false
         stdout: StdioCollector {
             onStreamFinished: {
@@ -63,7 +63,8 @@ ColumnLayout {
                     var line = lines[i].trim();
                     if (line) {
                         var parts = line.split(/\s+/);
-                        if (parts.length >= 3) {
+                        // filter formerly done by grep Device in the pipeline
+                        if (parts[0] === "Device" && parts.length >= 3) {
                             var mac = parts[1];
                             var name = parts.slice(2).join(" ");
                             var isConnected = name === connectedName;
@@ -1,19 +1,21 @@
-import Quickshell.Io
 import QtQuick
 import QtQuick.Layouts
 
+// Pure UI over the shared BrightnessService (passed down from shell.qml) —
+// the backend runs once per shell, not once per screen's drawer.
 ColumnLayout {
     id: root
     spacing: 6
     width: 248
     Layout.preferredWidth: 248
 
-    property int currentBrightness: 0
-    property int maxBrightness: 1
-    property int percent: maxBrightness > 0 ? Math.round(currentBrightness / maxBrightness * 100) : 0
-    property bool present: false
+    property var brightness: null
+    property bool present: brightness ? brightness.present : false
+    property int percent: brightness ? brightness.percent : 0
 
-    signal externalChange()
+    function setBrightness(percent) {
+        if (brightness) brightness.setBrightness(percent);
+    }
 
     function fillBar(percent, segments) {
         var filled = Math.round((percent / 100) * segments);
@@ -133,40 +135,4 @@ ColumnLayout {
         font.family: "monospace"
         font.pixelSize: 12
     }
-
-    Process {
-        id: readProc
-        property bool firstRun: true
-        command: ["sh", "-c", "dir=$(ls -d /sys/class/backlight/*/ 2>/dev/null | head -1); if [ -n \"$dir\" ]; then cat \"${dir}brightness\"; cat \"${dir}max_brightness\"; else echo missing; echo missing; fi"]
-        stdout: StdioCollector {
-            onStreamFinished: {
-                var lines = text.trim().split("\n");
-                if ((lines[0] || "").trim() === "missing") {
-                    root.present = false;
-                    return;
-                }
-                var newCur = parseInt(lines[0]) || 0;
-                var newMax = parseInt(lines[1]) || 1;
-                var changed = !readProc.firstRun && (newCur !== root.currentBrightness);
-                root.currentBrightness = newCur;
-                root.maxBrightness = newMax;
-                root.present = true;
-                if (changed) root.externalChange();
-                readProc.firstRun = false;
-            }
-        }
-    }
-
-    Process {
-        id: setProc
-        onExited: readProc.running = true
-    }
-
-    function setBrightness(percent) {
-        setProc.command = ["brightnessctl", "s", percent + "%"];
-        setProc.running = true;
-    }
-
-    Component.onCompleted: readProc.running = true
-    Timer { interval: 3000; running: true; repeat: true; onTriggered: readProc.running = true }
 }
@@ -0,0 +1,129 @@
+import Quickshell.Io
+import QtQuick
+
+// Owns the backlight backend: device detection, the udev monitor, the sysfs
+// FileView, and the brightnessctl setter. Spawn one of these per ShellRoot —
+// per-screen drawers and the OSD all share its cached state instead of each
+// running their own monitor + reader.
+Item {
+    id: service
+
+    property int currentBrightness: 0
+    property int maxBrightness: 1
+    // max is fixed after detection, so fold the zero-guard and divide into a
+    // scale factor computed once; the hot percent binding is a single multiply.
+    property real percentScale: maxBrightness > 0 ? 100 / maxBrightness : 0
+    property int percent: Math.round(currentBrightness * percentScale)
+    // Inverse scale for the setter's no-op check, also computed once.
+    property real rawScale: maxBrightness / 100
+    property bool present: false
+    // Resolved once at startup — the backlight device can't change at runtime.
+    property string backlightDir: ""
+    property string device: ""
+    // Rebuilt only when the device is detected; each set just appends the level.
+    property var setCmdPrefix: ["brightnessctl", "-d", device, "s"]
+    // Latest level requested while a set was still in flight (-1 = none).
+    property int pendingPercent: -1
+    // Shell sets this from drawer visibility; only gates the fallback poll —
+    // the udev monitor is event-driven and costs nothing while idle.
+    property bool pollWanted: false
+
+    signal externalChange()
+
+    // One-shot: find the backlight device and its (immutable) max once, so
+    // the per-change read below is just a reload of a known path.
+    Process {
+        id: detectProc
+        command: ["sh", "-c", "dir=$(ls -d /sys/class/backlight/*/ 2>/dev/null | head -1); if [ -n \"$dir\" ]; then echo \"$dir\"; cat \"${dir}max_brightness\"; else echo missing; fi"]
+        stdout: StdioCollector {
+            onStreamFinished: {
+                var lines = text.trim().split("\n");
+                if ((lines[0] || "").trim() === "missing") {
+                    service.present = false;
+                    return;
+                }
+                service.backlightDir = lines[0].trim();
+                var parts = service.backlightDir.split("/").filter(function(p) { return p.length > 0; });
+                service.device = parts[parts.length - 1];
+                service.maxBrightness = parseInt(lines[1]) || 1;
+                service.present = true;
+                brightnessFile.reload();
+            }
+        }
+    }
+
+    // In-process read of the cached path — no fork per brightness change.
+    // Loads once when detection fills in the path, then on each reload().
+    FileView {
+        id: brightnessFile
+        property bool firstRun: true
+        path: service.present ? service.backlightDir + "brightness" : ""
+        onLoaded: {
+            // parseInt stops at the trailing newline itself — no trim copy.
+            var newCur = parseInt(text()) || 0;
+            // Steady-state fast path: value unchanged, touch nothing — no
+            // property writes, no binding re-evaluation, no signal.
+            if (!firstRun && newCur === service.currentBrightness) return;
+            var wasFirst = firstRun;
+            firstRun = false;
+            service.currentBrightness = newCur;
+            if (!wasFirst) service.externalChange();
+        }
+    }
+
+    Process {
+        id: setProc
+        onExited: {
+            if (service.pendingPercent >= 0) {
+                var next = service.pendingPercent;
+                service.pendingPercent = -1;
+                service.setBrightness(next);
+            } else if (!monitorProc.running) {
+                // udev monitor already reports our own write; re-read manually
+                // only on the polling fallback.
+                brightnessFile.reload();
+            }
+        }
+    }
+
+    // Kernel pushes one uevent per real brightness change (keybinds, other
+    // tools, us), so we only re-read when something actually happened instead
+    // of waking every 3s. -u = udev events, post rule processing.
+    Process {
+        id: monitorProc
+        command: ["udevadm", "monitor", "-u", "-s", "backlight"]
+        running: true
+        stdout: SplitParser {
+            onRead: function(line) {
+                if (service.present && line.indexOf("change") !== -1)
+                    brightnessFile.reload();
+            }
+        }
+    }
+
+    // Coalesce rapid adjustments (button mashing, future drags): keep at most
+    // one brightnessctl in flight and remember only the latest target —
+    // intermediate levels are dropped, not queued.
+    function setBrightness(percent) {
+        // No-op check in raw units: on coarse backlights several percent
+        // values collapse to the same raw level, which a percent-space
+        // compare misses — those sets would fork brightnessctl for nothing.
+        if (Math.round(percent * service.rawScale) === service.currentBrightness) return;
+        if (setProc.running) {
+            service.pendingPercent = percent;
+            return;
+        }
+        setProc.command = service.setCmdPrefix.concat(percent + "%");
+        setProc.running = true;
+    }
+
+    function refresh() {
+        if (service.present) brightnessFile.reload();
+    }
+
+    Component.onCompleted: detectProc.running = true
+    onPollWantedChanged: if (pollWanted && present && !monitorProc.running) brightnessFile.reload()
+
+    // Fallback poll, only if udevadm isn't available (monitor process dead).
+    Timer { interval: 3000; running: service.pollWanted && service.present && !monitorProc.running; repeat: true; onTriggered: brightnessFile.reload() }
+}
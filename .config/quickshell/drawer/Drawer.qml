@@ -9,6 +9,7 @@ PanelWindow {
     property bool drawerOpen: false
     property bool drawerVisible: drawerOpen
     property var notificationStore: null
+    property var brightnessStore: null
 
     required property var screen
 
@@ -94,15 +95,15 @@ PanelWindow {
 
                 Rectangle { width: 248; height: 1; color: "#2a2e35"; Layout.preferredWidth: 248 }
 
-                SystemModule {}
+                SystemModule { active: drawerWindow.drawerVisible }
 
                 Rectangle { width: 248; height: 1; color: "#2a2e35"; Layout.preferredWidth: 248 }
 
-                BrightnessModule {}
+                BrightnessModule { brightness: drawerWindow.brightnessStore }
 
                 Rectangle { width: 248; height: 1; color: "#2a2e35"; Layout.preferredWidth: 248 }
 
-                MediaModule {}
+                MediaModule { active: drawerWindow.drawerVisible }
 
                 Rectangle { width: 248; height: 1; color: "#2a2e35"; Layout.preferredWidth: 248 }
 
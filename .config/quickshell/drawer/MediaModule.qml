@@ -8,6 +8,9 @@ ColumnLayout {
     width: 248
     Layout.preferredWidth: 248
 
+    // Drawer sets this from its visibility so we don't poll while hidden.
+    property bool active: true
+
     property string title: "no media"
     property string artist: ""
     property string status: ""
@@ -112,8 +115,9 @@ ColumnLayout {
     }
 
     Component.onCompleted: mediaProc.running = true
+    onActiveChanged: if (active) mediaProc.running = true
 
-    Timer { interval: 2000; running: true; repeat: true; onTriggered: mediaProc.running = true }
+    Timer { interval: 2000; running: root.active; repeat: true; onTriggered: mediaProc.running = true }
 
     component ActionCell: Rectangle {
         signal triggered()
@@ -8,6 +8,9 @@ ColumnLayout {
     width: 248
     Layout.preferredWidth: 248
 
+    // Drawer sets this from its visibility so we don't poll while hidden.
+    property bool active: true
+
     property int lastIdle: 0
     property int lastTotal: 0
     property int cpuPercent: 0
@@ -16,6 +19,9 @@ ColumnLayout {
     property int tempC: 0
     property string uptimeText: "--"
     property var cpuHistory: []
+    // Built once — regex literals inside the 2s handler would construct a
+    // fresh RegExp on every evaluation.
+    readonly property var whitespaceRe: /\s+/
 
     function fillBar(percent, segments) {
         var filled = Math.round((percent / 100) * segments);
@@ -159,7 +165,7 @@ ColumnLayout {
         stdout: StdioCollector {
             onStreamFinished: {
                 var lines = text.trim().split("\n");
-                var cpu = (lines[0] || "").trim().split(/\s+/).slice(1).map(function(v) { return parseInt(v); });
+                var cpu = (lines[0] || "").trim().split(root.whitespaceRe).slice(1).map(function(v) { return parseInt(v); });
                 if (cpu.length >= 4) {
                     var idle = cpu[3] + (cpu[4] || 0);
                     var total = 0;
@@ -177,7 +183,7 @@ ColumnLayout {
                     root.lastIdle = idle;
                 }
 
-                var mem = (lines[1] || "").trim().split(/\s+/);
+                var mem = (lines[1] || "").trim().split(root.whitespaceRe);
                 if (mem.length >= 2) {
                     var totalMem = parseInt(mem[0]);
                     var availableMem = parseInt(mem[1]);
@@ -198,8 +204,9 @@ ColumnLayout {
     }
 
     Component.onCompleted: statsProc.running = true
+    onActiveChanged: if (active) statsProc.running = true
 
-    Timer { interval: 2000; running: true; repeat: true; onTriggered: statsProc.running = true }
+    Timer { interval: 2000; running: root.active; repeat: true; onTriggered: statsProc.running = true }
 
     component MetricRow: ColumnLayout {
         property string label: ""
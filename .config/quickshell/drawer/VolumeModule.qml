@@ -44,11 +44,7 @@ ColumnLayout {
             color: "#c8ccd4"
         }
 
-        onMoved: {
-            volumeStatus.text = "applying...";
-            volSetProc.command = ["pactl", "set-sink-volume", "@DEFAULT_SINK@", Math.round(value) + "%"];
-            volSetProc.running = true;
-        }
+        onMoved: applyVolume(setCmdPrefix.concat(Math.round(value) + "%"))
     }
 
     Rectangle {
@@ -88,10 +84,34 @@ ColumnLayout {
     }
 
     property int volumePercentValue: 0
+    readonly property var setCmdPrefix: ["pactl", "set-sink-volume", "@DEFAULT_SINK@"]
 
     Process {
         id: volSetProc
-        onExited: refreshVolume()
+        // Set queued while a pactl was still in flight (null = none).
+        property var pending: null
+        onExited: {
+            if (pending) {
+                command = pending;
+                pending = null;
+                running = true;
+            } else {
+                refreshVolume();
+            }
+        }
+    }
+
+    // Fires immediately when idle (no added latency for single clicks) but
+    // collapses a slider drag or wheel burst into latest-wins: at most one
+    // pactl in flight, intermediate positions dropped.
+    function applyVolume(cmd) {
+        volumeStatus.text = "applying...";
+        if (volSetProc.running) {
+            volSetProc.pending = cmd;
+            return;
+        }
+        volSetProc.command = cmd;
+        volSetProc.running = true;
     }
 
     Process {
@@ -125,15 +145,13 @@ ColumnLayout {
 
     Component.onCompleted: refreshVolume()
 
+    // Absolute targets (not +5%/-5%) so latest-wins coalescing can't drop
+    // steps from a fast scroll; the slider tracks locally between refreshes.
     WheelHandler {
         onWheel: {
-            volumeStatus.text = "applying...";
-            if (wheel.angleDelta.y > 0) {
-                volSetProc.command = ["pactl", "set-sink-volume", "@DEFAULT_SINK@", "+5%"];
-            } else {
-                volSetProc.command = ["pactl", "set-sink-volume", "@DEFAULT_SINK@", "-5%"];
-            }
-            volSetProc.running = true;
+            var v = Math.max(0, Math.min(100, volumeSlider.value + (wheel.angleDelta.y > 0 ? 5 : -5)));
+            volumeSlider.value = v;
+            applyVolume(setCmdPrefix.concat(Math.round(v) + "%"));
         }
     }
 
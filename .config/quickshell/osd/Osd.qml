@@ -43,16 +43,21 @@ PanelWindow {
         return "▆".repeat(filled) + "▁".repeat(segments - filled);
     }
 
+    // mode → [header label, symbol]. One table lookup per mode change instead
+    // of re-running string-compare chains in both text bindings. New OSD
+    // types: add a row here.
+    readonly property var modeInfo: ({
+        "volume": ["VOLUME", "♪"],
+        "brightness": ["BRIGHTNESS", "*"],
+        "mic": ["MIC", "ψ"]
+    })
+
     function modeLabel() {
-        if (root.mode === "brightness") return "BRIGHTNESS";
-        if (root.mode === "mic") return "MIC";
-        return "VOLUME";
+        return (root.modeInfo[root.mode] || root.modeInfo["volume"])[0];
     }
 
     function modeSymbol() {
-        if (root.mode === "brightness") return "*";
-        if (root.mode === "mic") return "ψ";
-        return "♪";
+        return (root.modeInfo[root.mode] || root.modeInfo["volume"])[1];
     }
 
     Rectangle {
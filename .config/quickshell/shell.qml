@@ -63,7 +63,13 @@ ShellRoot {
         }
 
         function showBrightness(): void {
-            brightnessReadProc.running = true;
+            if (!brightnessService.present) return;
+            // The udev monitor has normally already folded the keybind's
+            // change into the cache by the time the IPC call lands, so
+            // broadcast it straight away; the refresh covers the
+            // no-udevadm fallback for the next press.
+            brightnessService.refresh();
+            osdBroadcast.broadcast("brightness", brightnessService.percent, false);
         }
 
         function showMic(): void {
@@ -124,16 +130,11 @@ ShellRoot {
         }
     }
 
-    Process {
-        id: brightnessReadProc
-        command: ["sh", "-c", "dir=$(ls -d /sys/class/backlight/*/ 2>/dev/null | head -1); if [ -n \"$dir\" ]; then cur=$(cat \"${dir}brightness\"); max=$(cat \"${dir}max_brightness\"); [ \"$max\" -gt 0 ] && echo $((cur * 100 / max)) || echo 0; else echo missing; fi"]
-        stdout: StdioCollector {
-            onStreamFinished: {
-                var line = text.trim();
-                if (line === "missing") return;
-                osdBroadcast.broadcast("brightness", parseInt(line) || 0, false);
-            }
-        }
+    // One backlight backend for the whole shell — per-screen drawer modules
+    // and the OSD all read its cached state (kept fresh by its udev monitor).
+    BrightnessService {
+        id: brightnessService
+        pollWanted: root.drawerOpen
     }
 
     Process {
@@ -189,6 +190,7 @@ ShellRoot {
                 screen: modelData
                 drawerOpen: root.drawerOpen
                 notificationStore: notificationDaemon
+                brightnessStore: brightnessService
             }
         }
     }